@@ -1,5 +1,8 @@
 """Pytest configuration and shared fixtures for mac-calendar-mcp tests."""
 
+import collections
+import concurrent.futures
+import threading
 import pytest
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
@@ -25,12 +28,17 @@ from tests.mocks.mock_eventkit import (
 )
 
 
+@pytest.fixture(scope="session")
+def _shared_event_store():
+    """One MockEKEventStore reused by every test through mock_event_store."""
+    return MockEKEventStore()
+
+
 @pytest.fixture
-def mock_event_store():
-    """Mock EKEventStore with controlled behavior."""
-    store = MockEKEventStore()
-    store.set_authorized(True)
-    return store
+def mock_event_store(_shared_event_store):
+    """Mock EKEventStore with controlled behavior, emptied for each test."""
+    _shared_event_store.reset()
+    return _shared_event_store
 
 
 @pytest.fixture
@@ -151,9 +159,11 @@ def populated_event_store(
     for calendar in mock_calendars:
         mock_event_store.add_calendar(calendar)
     
-    mock_event_store.add_event(sample_event_simple)
-    mock_event_store.add_event(sample_event_with_attendees)
-    mock_event_store.add_event(sample_event_all_day)
+    mock_event_store.bulk_add_events([
+        sample_event_simple,
+        sample_event_with_attendees,
+        sample_event_all_day,
+    ])
     
     return mock_event_store
 
@@ -192,9 +202,75 @@ def calendar_server(populated_event_store):
     return server
 
 
+# One recorded MockEKEventStore call: its arguments and the thread that made it
+StoreCall = collections.namedtuple("StoreCall", ["args", "thread"])
+
+
+@pytest.fixture
+def store_calls(monkeypatch):
+    """Record calls to a MockEKEventStore method: store_calls(name) returns the live list of StoreCalls."""
+    def record(method_name):
+        method = getattr(MockEKEventStore, method_name)
+        calls = []
+
+        def recording(store, *args):
+            calls.append(StoreCall(args, threading.current_thread()))
+            return method(store, *args)
+
+        monkeypatch.setattr(MockEKEventStore, method_name, recording)
+        return calls
+
+    return record
+
+
+class InlineExecutor(concurrent.futures.Executor):
+    """Executor that runs each call on the submitting thread.
+
+    The mocks never block, so tests that do not exercise threading can skip
+    the worker-pool hop with CalendarServer.set_executor(InlineExecutor()).
+    """
+
+    def submit(self, fn, *args, **kwargs):
+        future = concurrent.futures.Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as exc:
+            future.set_exception(exc)
+        return future
+
+
+@pytest.fixture
+def inline_executor():
+    """Executor running EventKit work inline on the event loop thread."""
+    return InlineExecutor()
+
+
+@pytest.fixture(scope="session")
+def empty_authorized_store():
+    """Authorized MockEKEventStore with no data, shared by the whole session.
+
+    Only for tests that never add data to the store.
+    """
+    store = MockEKEventStore()
+    return store
+
+
+@pytest.fixture(scope="module")
+def empty_calendar_server(empty_authorized_store):
+    """CalendarServer over the shared empty store, built once per module, running work inline."""
+    from mac_calendar_mcp.server import CalendarServer
+
+    server = CalendarServer()
+    server.access_granted = True
+    server.event_store = empty_authorized_store
+    server.set_executor(InlineExecutor())
+
+    yield server
+    server.close()
+
+
 @pytest.fixture(autouse=True)
 def reset_mock_state():
     """Reset mock EventKit state before each test."""
-    MockEKEventStore._class_auth_status = None
+    MockEKEventStore._class_auth_status = EKAuthorizationStatusAuthorized
     yield
-    MockEKEventStore._class_auth_status = None
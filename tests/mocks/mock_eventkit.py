@@ -1,12 +1,75 @@
 """Mock PyObjC EventKit objects for testing without real calendar access."""
 
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
 from datetime import datetime
+from enum import IntEnum
+from itertools import chain
+from operator import itemgetter
 from typing import Optional, List, Any
 
 
+# Mock EventKit constants, grouped as IntEnums (members still compare and
+# hash as the plain ints EventKit uses)
+class EKEntityType(IntEnum):
+    Event = 0
+    Reminder = 1
+
+
+class EKParticipantStatus(IntEnum):
+    Unknown = 0
+    Pending = 1
+    Accepted = 2
+    Declined = 3
+    Tentative = 4
+
+
+class EKAuthorizationStatus(IntEnum):
+    NotDetermined = 0
+    Restricted = 1
+    Denied = 2
+    Authorized = 3
+
+
+class EKEventAvailability(IntEnum):
+    Busy = 0
+    Free = 1
+
+
+class EKReminderPriority(IntEnum):
+    None_ = 0
+    High = 1
+    Medium = 5
+    Low = 9
+
+
+# Flat names matching the PyObjC EventKit module
+EKEntityTypeEvent = EKEntityType.Event
+EKEntityTypeReminder = EKEntityType.Reminder
+EKParticipantStatusUnknown = EKParticipantStatus.Unknown
+EKParticipantStatusPending = EKParticipantStatus.Pending
+EKParticipantStatusAccepted = EKParticipantStatus.Accepted
+EKParticipantStatusDeclined = EKParticipantStatus.Declined
+EKParticipantStatusTentative = EKParticipantStatus.Tentative
+EKAuthorizationStatusNotDetermined = EKAuthorizationStatus.NotDetermined
+EKAuthorizationStatusRestricted = EKAuthorizationStatus.Restricted
+EKAuthorizationStatusDenied = EKAuthorizationStatus.Denied
+EKAuthorizationStatusAuthorized = EKAuthorizationStatus.Authorized
+EKEventAvailabilityBusy = EKEventAvailability.Busy
+EKEventAvailabilityFree = EKEventAvailability.Free
+EKReminderPriorityNone = EKReminderPriority.None_
+EKReminderPriorityHigh = EKReminderPriority.High
+EKReminderPriorityMedium = EKReminderPriority.Medium
+EKReminderPriorityLow = EKReminderPriority.Low
+
+
 class MockNSDate:
     """Mock NSDate for testing."""
 
+    # Fixed attributes keep the many mocks built by stress tests small
+    __slots__ = ("_timestamp",)
+
     def __init__(self, timestamp: float):
         self._timestamp = timestamp
 
@@ -18,9 +81,47 @@ class MockNSDate:
         return cls(timestamp)
 
 
+def _kvc_value(obj: Any, key: str) -> Any:
+    """Resolve a single KVC key the way Foundation does for simple getters."""
+    for name in (key, "is" + key[:1].upper() + key[1:]):
+        accessor = getattr(obj, name, None)
+        if accessor is not None:
+            return accessor()
+    raise AttributeError(f"{type(obj).__name__} is not key value coding-compliant for '{key}'")
+
+
+class MockNSArray(list):
+    """Mock NSArray supporting the KVC collection accessors used by the server."""
+
+    __slots__ = ()
+
+    def count(self) -> int:
+        return len(self)
+
+    def objectAtIndex_(self, index: int) -> Any:
+        return self[index]
+
+    def valueForKey_(self, key: str) -> "MockNSArray":
+        return self.valueForKeyPath_(key)
+
+    def valueForKeyPath_(self, key_path: str) -> "MockNSArray":
+        """Return the key path's value for each element (None stands in for NSNull)."""
+        keys = key_path.split(".")
+        values = MockNSArray()
+        for obj in self:
+            for key in keys:
+                if obj is None:
+                    break
+                obj = _kvc_value(obj, key)
+            values.append(obj)
+        return values
+
+
 class MockEKParticipant:
     """Mock EKParticipant for testing."""
 
+    __slots__ = ("_name", "_email", "_status", "_is_current_user")
+
     def __init__(
         self,
         name: str,
@@ -46,9 +147,35 @@ class MockEKParticipant:
         return self._is_current_user
 
 
+class MockSource:
+    """Mock EKSource for testing."""
+
+    __slots__ = ("_source_title",)
+
+    def __init__(self, source_title: str):
+        self._source_title = source_title
+
+    def title(self) -> str:
+        return self._source_title
+
+
+class MockOrganizer:
+    """Mock organizer participant for testing."""
+
+    __slots__ = ("_name",)
+
+    def __init__(self, name: str):
+        self._name = name
+
+    def name(self) -> str:
+        return self._name
+
+
 class MockEKCalendar:
     """Mock EKCalendar for testing."""
 
+    __slots__ = ("_title", "_type", "_color", "_source_title", "_source")
+
     def __init__(
         self,
         title: str,
@@ -60,6 +187,7 @@ class MockEKCalendar:
         self._type = cal_type
         self._color = color
         self._source_title = source_title
+        self._source = MockSource(source_title)
 
     def title(self) -> str:
         return self._title
@@ -72,17 +200,14 @@ class MockEKCalendar:
 
     def source(self):
         """Return mock source object."""
-        class MockSource:
-            def __init__(self, source_title):
-                self._source_title = source_title
-            def title(self):
-                return self._source_title
-        return MockSource(self._source_title)
+        return self._source
 
 
 class MockEKDateComponents:
     """Mock NSDateComponents for testing."""
 
+    __slots__ = ("_year", "_month", "_day", "_hour", "_minute", "_second")
+
     def __init__(self, year: int, month: int, day: int, hour: int = 0, minute: int = 0, second: int = 0):
         self._year = year
         self._month = month
@@ -113,6 +238,11 @@ class MockEKDateComponents:
 class MockEKReminder:
     """Mock EKReminder for testing."""
 
+    __slots__ = (
+        "_title", "_calendar", "_calendar_title", "_due_date_components",
+        "_is_completed", "_completion_date", "_priority", "_notes",
+    )
+
     def __init__(
         self,
         title: str,
@@ -125,6 +255,7 @@ class MockEKReminder:
     ):
         self._title = title
         self._calendar = calendar
+        self._calendar_title = calendar.title()
         self._due_date_components = due_date_components
         self._is_completed = is_completed
         self._completion_date = (
@@ -158,6 +289,12 @@ class MockEKReminder:
 class MockEKEvent:
     """Mock EKEvent for testing."""
 
+    __slots__ = (
+        "_title", "_start", "_end", "_start_ts", "_end_ts", "_calendar",
+        "_calendar_title", "_notes", "_organizer", "_attendees",
+        "_is_all_day", "_location", "_url", "_availability",
+    )
+
     def __init__(
         self,
         title: str,
@@ -173,12 +310,17 @@ class MockEKEvent:
         availability: int = 0  # 0 = busy by default
     ):
         self._title = title
-        self._start = MockNSDate(start.timestamp())
-        self._end = MockNSDate(end.timestamp())
+        self._start_ts = start.timestamp()
+        self._end_ts = end.timestamp()
+        self._start = MockNSDate(self._start_ts)
+        self._end = MockNSDate(self._end_ts)
         self._calendar = calendar
+        self._calendar_title = calendar.title()
         self._notes = notes
-        self._organizer_name = organizer_name
-        self._attendees = attendees or []
+        self._organizer = MockOrganizer(organizer_name) if organizer_name else None
+        # Attendee lists are never mutated, so events without any share one
+        # empty tuple
+        self._attendees = tuple(attendees) if attendees else ()
         self._is_all_day = is_all_day
         self._location = location
         self._url = url
@@ -201,16 +343,7 @@ class MockEKEvent:
 
     def organizer(self):
         """Return mock organizer object."""
-        if not self._organizer_name:
-            return None
-
-        class MockOrganizer:
-            def __init__(self, name: str):
-                self._name = name
-            def name(self) -> str:
-                return self._name
-
-        return MockOrganizer(self._organizer_name)
+        return self._organizer
 
     def attendees(self):
         return self._attendees
@@ -228,17 +361,57 @@ class MockEKEvent:
         return self._availability
 
 
+class MockPredicate:
+    """Mock event predicate holding the query window and calendars."""
+
+    __slots__ = ("start", "end", "start_ts", "end_ts", "calendars", "calendar_titles")
+
+    def __init__(self, start, end, cals):
+        self.start = start
+        self.end = end
+        self.start_ts = start.timeIntervalSince1970()
+        self.end_ts = end.timeIntervalSince1970()
+        self.calendars = cals
+        self.calendar_titles = frozenset(cal.title() for cal in cals)
+
+
+class MockReminderPredicate:
+    """Mock reminder predicate holding the requested calendars."""
+
+    __slots__ = ("calendars", "calendar_titles")
+
+    def __init__(self, cals):
+        self.calendars = cals
+        self.calendar_titles = frozenset(cal.title() for cal in cals)
+
+
 class MockEKEventStore:
     """Mock EKEventStore for testing."""
 
-    # Class-level authorization status for authorizationStatusForEntityType_
-    _class_auth_status = None
+    __slots__ = (
+        "_calendars", "_events", "_reminders", "_authorized",
+        "_events_by_calendar", "_longest_event_by_calendar",
+        "_reminder_indexes_by_calendar",
+    )
+
+    # Class-level authorization status for authorizationStatusForEntityType_.
+    # Nearly every test wants access, so stores start authorized and the
+    # rare negative test calls set_denied()
+    _class_auth_status = EKAuthorizationStatusAuthorized
 
     def __init__(self):
         self._calendars = []
         self._events = []
         self._reminders = []
-        self._authorized = False
+        self._authorized = True
+        # Calendar title -> parallel columns kept sorted by start: start
+        # timestamps, end timestamps, and the _events index of each event
+        self._events_by_calendar = {}
+        # Calendar title -> longest event duration in seconds, which bounds
+        # how far before a range start an overlapping event can begin
+        self._longest_event_by_calendar = {}
+        # Calendar title -> _reminders indexes, in insertion order
+        self._reminder_indexes_by_calendar = {}
 
     @classmethod
     def alloc(cls):
@@ -252,18 +425,19 @@ class MockEKEventStore:
     @classmethod
     def authorizationStatusForEntityType_(cls, entity_type):
         """Check authorization status (class method)."""
-        if cls._class_auth_status is not None:
-            return cls._class_auth_status
-        return EKAuthorizationStatusNotDetermined
+        return cls._class_auth_status
 
     def set_authorized(self, authorized: bool):
         """Set authorization status for testing."""
         self._authorized = authorized
         # Also set class-level status
-        if authorized:
-            MockEKEventStore._class_auth_status = EKAuthorizationStatusAuthorized
-        else:
-            MockEKEventStore._class_auth_status = EKAuthorizationStatusDenied
+        MockEKEventStore._class_auth_status = (
+            EKAuthorizationStatusAuthorized if authorized else EKAuthorizationStatusDenied
+        )
+
+    def set_denied(self):
+        """Deny access for testing."""
+        self.set_authorized(False)
 
     def add_calendar(self, calendar):
         """Add a mock calendar."""
@@ -271,10 +445,61 @@ class MockEKEventStore:
 
     def add_event(self, event):
         """Add a mock event."""
+        start_ts = event._start_ts
+        starts, ends, order = self._events_by_calendar.setdefault(
+            event._calendar_title, (array("d"), array("d"), [])
+        )
+        position = bisect_right(starts, start_ts)
+        starts.insert(position, start_ts)
+        ends.insert(position, event._end_ts)
+        order.insert(position, len(self._events))
         self._events.append(event)
+        longest = self._longest_event_by_calendar
+        title = event._calendar_title
+        longest[title] = max(longest.get(title, 0.0), event._end_ts - start_ts)
+
+    def bulk_add_events(self, events):
+        """Add many mock events, re-sorting each touched calendar's index once."""
+        added = {}
+        for event in events:
+            added.setdefault(event._calendar_title, []).append(
+                (event._start_ts, event._end_ts, len(self._events))
+            )
+            self._events.append(event)
+
+        for title, rows in added.items():
+            starts, ends, order = self._events_by_calendar.get(title, ((), (), ()))
+            # The sort is stable, so events sharing a start keep insertion
+            # order exactly as repeated add_event calls would
+            rows = sorted(chain(zip(starts, ends, order), rows), key=itemgetter(0))
+            self._events_by_calendar[title] = (
+                array("d", [row[0] for row in rows]),
+                array("d", [row[1] for row in rows]),
+                [row[2] for row in rows],
+            )
+            self._longest_event_by_calendar[title] = max(
+                0.0, max(row[1] - row[0] for row in rows)
+            )
+
+    def clear_events(self):
+        """Remove every mock event, keeping calendars and reminders."""
+        self._events.clear()
+        self._events_by_calendar.clear()
+        self._longest_event_by_calendar.clear()
+
+    def reset(self):
+        """Return the store to its freshly constructed, authorized, empty state."""
+        self._calendars.clear()
+        self.clear_events()
+        self._reminders.clear()
+        self._reminder_indexes_by_calendar.clear()
+        self._authorized = True
 
     def add_reminder(self, reminder):
         """Add a mock reminder."""
+        self._reminder_indexes_by_calendar.setdefault(reminder._calendar_title, []).append(
+            len(self._reminders)
+        )
         self._reminders.append(reminder)
 
     def calendarsForEntityType_(self, entity_type: int):
@@ -288,78 +513,61 @@ class MockEKEventStore:
         calendars
     ):
         """Return a mock predicate (just store the params)."""
-        class MockPredicate:
-            def __init__(self, start, end, cals):
-                self.start = start
-                self.end = end
-                self.calendars = cals
-
         return MockPredicate(start_date, end_date, calendars)
 
     def eventsMatchingPredicate_(self, predicate):
         """Return events matching the predicate."""
-        start_ts = predicate.start.timeIntervalSince1970()
-        end_ts = predicate.end.timeIntervalSince1970()
-        calendar_titles = {cal.title() for cal in predicate.calendars}
-
-        # Filter events by date range and calendars
-        matching = []
-        for event in self._events:
-            event_start = event.startDate().timeIntervalSince1970()
-            event_end = event.endDate().timeIntervalSince1970()
-            event_calendar = event.calendar().title()
-
-            # Check if event overlaps with date range
-            if event_start <= end_ts and event_end >= start_ts:
-                # Check if calendar matches
-                if event_calendar in calendar_titles:
-                    matching.append(event)
-
-        return matching
+        start_ts = predicate.start_ts
+        end_ts = predicate.end_ts
+        calendar_titles = predicate.calendar_titles
+
+        # Only the requested calendars are visited, and in each only events
+        # starting by the range end can overlap it. No event lasts longer
+        # than the calendar's longest one, so any starting earlier than that
+        # before the range start has already ended; bisect both bounds of
+        # the sorted starts and check the ends column on that slice alone
+        by_calendar = self._events_by_calendar
+        longest = self._longest_event_by_calendar
+        matches = []
+        for title in calendar_titles & by_calendar.keys():
+            starts, ends, order = by_calendar[title]
+            lower = bisect_left(starts, start_ts - longest[title])
+            upper = bisect_right(starts, end_ts)
+            matches.extend(
+                index
+                for index, event_end in zip(order[lower:upper], ends[lower:upper])
+                if event_end >= start_ts
+            )
+        matches.sort()
+        # Return matches in insertion order, as the full scan did
+        events = self._events
+        return MockNSArray(events[index] for index in matches)
 
     def requestFullAccessToEventsWithCompletion_(self, completion_handler):
         """Mock permission request."""
-        # Call completion handler immediately with authorized status
-        completion_handler(self._authorized, None)
+        # EventKit calls the handler later on one of its own queues, never on
+        # the caller's stack, so reply from a separate thread the same way
+        threading.Thread(
+            target=completion_handler, args=(self._authorized, None), daemon=True
+        ).start()
 
     def predicateForRemindersInCalendars_(self, calendars):
         """Return a mock predicate for reminders."""
-        class MockReminderPredicate:
-            def __init__(self, cals):
-                self.calendars = cals
-
         return MockReminderPredicate(calendars)
 
     def fetchRemindersMatchingPredicate_completion_(self, predicate, completion_handler):
         """Fetch reminders matching predicate."""
-        calendar_titles = {cal.title() for cal in predicate.calendars}
+        calendar_titles = predicate.calendar_titles
 
-        # Filter reminders by calendar
-        matching = []
-        for reminder in self._reminders:
-            reminder_calendar = reminder.calendar().title()
-            if reminder_calendar in calendar_titles:
-                matching.append(reminder)
+        # Gather the requested calendars' reminders from the index, back in
+        # insertion order as a full scan would return them
+        by_calendar = self._reminder_indexes_by_calendar
+        indexes = sorted(
+            index for title in calendar_titles for index in by_calendar.get(title, ())
+        )
+        reminders = self._reminders
+        matching = [reminders[index] for index in indexes]
 
         # Call completion handler immediately
         completion_handler(matching)
 
-
-# Mock EventKit constants
-EKEntityTypeEvent = 0
-EKEntityTypeReminder = 1
-EKParticipantStatusUnknown = 0
-EKParticipantStatusPending = 1
-EKParticipantStatusAccepted = 2
-EKParticipantStatusDeclined = 3
-EKParticipantStatusTentative = 4
-EKAuthorizationStatusNotDetermined = 0
-EKAuthorizationStatusRestricted = 1
-EKAuthorizationStatusDenied = 2
-EKAuthorizationStatusAuthorized = 3
-EKEventAvailabilityBusy = 0
-EKEventAvailabilityFree = 1
-EKReminderPriorityNone = 0
-EKReminderPriorityHigh = 1
-EKReminderPriorityMedium = 5
-EKReminderPriorityLow = 9
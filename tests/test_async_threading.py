@@ -8,21 +8,10 @@ from datetime import datetime
 class TestAsyncThreading:
     """Test async/threading integration"""
 
-    async def test_get_events_is_async(self, calendar_server):
-        """Test that get_events is an async function"""
-        result = calendar_server.get_events()
-        assert asyncio.iscoroutine(result)
-        await result  # Clean up coroutine
-
-    async def test_get_calendars_is_async(self, calendar_server):
-        """Test that get_calendars is an async function"""
-        result = calendar_server.get_calendars()
-        assert asyncio.iscoroutine(result)
-        await result  # Clean up coroutine
-
-    async def test_request_access_is_async(self, calendar_server):
-        """Test that request_access is an async function"""
-        result = calendar_server.request_access()
+    @pytest.mark.parametrize("method_name", ["get_events", "get_calendars", "request_access"])
+    async def test_method_is_async(self, calendar_server, method_name):
+        """Test that EventKit-backed methods are async functions"""
+        result = getattr(calendar_server, method_name)()
         assert asyncio.iscoroutine(result)
         await result  # Clean up coroutine
 
@@ -53,6 +42,19 @@ class TestAsyncThreading:
         events = await calendar_server.get_events()
         assert isinstance(events, list)
 
+    async def test_eventkit_work_runs_on_chosen_executor(self, calendar_server, inline_executor, store_calls):
+        """Test EventKit work uses the dedicated pool unless another executor is set"""
+        import threading
+
+        calls = store_calls("eventsMatchingPredicate_")
+
+        await calendar_server.get_events(start_date="2024-12-15", end_date="2024-12-15")
+        assert calls[-1].thread.name.startswith("ek")
+
+        calendar_server.set_executor(inline_executor)
+        await calendar_server.get_events(start_date="2024-12-16", end_date="2024-12-16")
+        assert calls[-1].thread is threading.current_thread()
+
     async def test_permission_request_threading(self, calendar_server):
         """Test permission request uses threading for callback"""
         result = await calendar_server.request_access()
@@ -1,6 +1,7 @@
 """Tests for core CalendarServer functionality"""
 import pytest
-from datetime import datetime
+import json
+from datetime import datetime, timedelta
 
 
 @pytest.mark.asyncio
@@ -131,6 +132,16 @@ class TestCalendarServer:
             assert isinstance(start, datetime)
             assert isinstance(end, datetime)
 
+    async def test_event_fields_are_json_native(self, calendar_server):
+        """Test event dicts encode without the default=str fallback"""
+        events = await calendar_server.get_events(
+            start_date="2024-12-15",
+            end_date="2024-12-25"
+        )
+        assert events
+        # Dates are already ISO strings, so the stdlib encoder needs no hook
+        json.dumps(events)
+
     async def test_get_calendars_returns_list(self, calendar_server):
         """Test get_calendars returns a list"""
         calendars = await calendar_server.get_calendars()
@@ -163,3 +174,174 @@ class TestCalendarServer:
             calendar_names=["Nonexistent Calendar"]
         )
         assert len(events) == 0
+
+    async def test_calendar_list_is_cached(self, calendar_server, store_calls):
+        """Test calendars are fetched once and refetched after a store change"""
+        calls = store_calls("calendarsForEntityType_")
+
+        await calendar_server.get_events(start_date="2024-12-15", end_date="2024-12-25")
+        await calendar_server.get_calendars()
+        assert len(calls) == 1
+
+        calendar_server._on_store_changed()
+        await calendar_server.get_calendars()
+        assert len(calls) == 2
+
+    async def test_calendar_list_expires(self, calendar_server, store_calls):
+        """Test cached calendars are refetched once the TTL passes without a change notification"""
+        calls = store_calls("calendarsForEntityType_")
+
+        calendar_server._cache_ttl = 0
+        calendar_server._on_store_changed()
+        await calendar_server.get_calendars()
+        await calendar_server.get_calendars()
+        assert len(calls) == 2
+
+    async def test_calendars_cached_per_entity_type(self, calendar_server, store_calls):
+        """Test event and reminder calendars are each fetched once"""
+        from tests.mocks.mock_eventkit import EKEntityTypeEvent, EKEntityTypeReminder
+
+        calls = store_calls("calendarsForEntityType_")
+
+        for _ in range(2):
+            await calendar_server.get_events(start_date="2024-12-15", end_date="2024-12-25")
+            await calendar_server.get_reminders(start_date="2024-12-15", end_date="2024-12-25")
+        assert sorted(call.args[0] for call in calls) == sorted([EKEntityTypeEvent, EKEntityTypeReminder])
+
+    async def test_repeated_query_is_cached(self, calendar_server, store_calls):
+        """Test identical queries reuse results until the store changes"""
+        calls = store_calls("eventsMatchingPredicate_")
+
+        first = await calendar_server.get_events(start_date="2024-12-15", end_date="2024-12-25")
+        second = await calendar_server.get_events(start_date="2024-12-15", end_date="2024-12-25")
+        assert len(calls) == 1
+        assert second == first
+
+        # Filters are applied while building, so they get their own entry
+        all_day = await calendar_server.get_events(
+            start_date="2024-12-15", end_date="2024-12-25", all_day_only=True
+        )
+        assert len(calls) == 2
+        assert all(event['all_day'] for event in all_day)
+        assert len(all_day) < len(first)
+
+        calendar_server._on_store_changed()
+        await calendar_server.get_events(start_date="2024-12-15", end_date="2024-12-25")
+        assert len(calls) == 3
+
+    async def test_cached_results_expire_and_are_copies(self, calendar_server, store_calls):
+        """Test cached queries expire after the TTL and hand out independent dicts"""
+        calls = store_calls("eventsMatchingPredicate_")
+
+        first = await calendar_server.get_events(start_date="2024-12-15", end_date="2024-12-25")
+        first[0]["title"] = "Changed by caller"
+        second = await calendar_server.get_events(start_date="2024-12-15", end_date="2024-12-25")
+        assert len(calls) == 1
+        assert second[0]["title"] != "Changed by caller"
+
+        calendar_server._cache_ttl = 0
+        calendar_server._on_store_changed()
+        await calendar_server.get_events(start_date="2024-12-15", end_date="2024-12-25")
+        await calendar_server.get_events(start_date="2024-12-15", end_date="2024-12-25")
+        assert len(calls) == 3
+
+    async def test_cached_attendees_are_copies(self, calendar_server):
+        """Test editing a result's attendees does not change later cached results"""
+        first = await calendar_server.get_events(start_date="2024-12-26", end_date="2024-12-26")
+        sync = next(event for event in first if event['title'] == "Project Sync")
+        sync['attendees'][0]['status'] = "Changed by caller"
+        sync['attendees'].append({"name": "Intruder"})
+
+        second = await calendar_server.get_events(start_date="2024-12-26", end_date="2024-12-26")
+        sync = next(event for event in second if event['title'] == "Project Sync")
+        assert sync['attendees'][0]['status'] == "Accepted"
+        assert len(sync['attendees']) == 2
+
+    @pytest.mark.parametrize("start_date, end_date", [
+        ("2024-12-25T00:00:00+00:00", "2024-12-26"),
+        ("2024-12-25", "2024-12-26T10:00:00+00:00"),
+        ("2024-10-01T00:00:00+00:00", "2024-12-31"),
+    ])
+    async def test_mixed_aware_and_naive_bounds(self, calendar_server, start_date, end_date):
+        """Test a range with only one offset-aware bound still returns its events"""
+        events = await calendar_server.get_events(start_date=start_date, end_date=end_date)
+        titles = [event['title'] for event in events]
+        assert titles.count("Team Meeting") == 1
+
+    async def test_calendar_filter_matches_duplicate_titles(self, calendar_server, mock_event_store):
+        """Test every calendar sharing a requested title is queried"""
+        from tests.mocks.mock_eventkit import MockEKEvent, MockEKCalendar
+
+        other_work = MockEKCalendar("Work", source_title="Google")
+        mock_event_store.add_calendar(other_work)
+        mock_event_store.add_event(MockEKEvent(
+            title="Google Work Sync",
+            calendar=other_work,
+            start=datetime(2024, 12, 20, 9, 0, 0),
+            end=datetime(2024, 12, 20, 10, 0, 0),
+        ))
+
+        events = await calendar_server.get_events(
+            start_date="2024-12-15",
+            end_date="2024-12-25",
+            calendar_names=["Work"]
+        )
+        titles = {event['title'] for event in events}
+        assert {"Team Meeting", "Google Work Sync"} <= titles
+
+    async def test_long_range_is_fetched_in_windows(self, calendar_server, mock_event_store, mock_calendar_work, store_calls):
+        """Test long ranges are fetched in chunks and events crossing a chunk boundary appear once"""
+        from tests.mocks.mock_eventkit import MockEKEvent
+
+        mock_event_store.add_event(MockEKEvent(
+            title="Offsite",
+            calendar=mock_calendar_work,
+            start=datetime(2024, 1, 30, 9, 0, 0),
+            end=datetime(2024, 2, 2, 17, 0, 0),
+        ))
+        mock_event_store.add_event(MockEKEvent(
+            title="Planning",
+            calendar=mock_calendar_work,
+            start=datetime(2024, 3, 12, 9, 0, 0),
+            end=datetime(2024, 3, 12, 10, 0, 0),
+        ))
+
+        calls = store_calls("eventsMatchingPredicate_")
+
+        events = await calendar_server.get_events(start_date="2024-01-01", end_date="2024-06-30")
+        titles = [event['title'] for event in events]
+        assert len(calls) > 1
+        assert titles.count("Offsite") == 1
+        assert titles.count("Planning") == 1
+
+        # The merged result is cached under the whole range
+        fetches = len(calls)
+        again = await calendar_server.get_events(start_date="2024-01-01", end_date="2024-06-30")
+        assert len(calls) == fetches
+        assert again == events
+
+
+    async def test_chunked_and_single_window_results_share_start_order(
+        self, calendar_server, mock_event_store, mock_calendar_work, monkeypatch
+    ):
+        """Test long ranges return events sorted by start, exactly as a single-window query does"""
+        import mac_calendar_mcp.server as server_module
+        from tests.mocks.mock_eventkit import MockEKEvent
+
+        # Added latest-first, so store order is the reverse of start order
+        starts = [datetime(2024, month, day, 9, 0, 0) for month in (5, 3, 1) for day in (20, 2)]
+        mock_event_store.bulk_add_events([
+            MockEKEvent(title=f"Event {start:%m-%d}", calendar=mock_calendar_work,
+                        start=start, end=start.replace(hour=10))
+            for start in starts
+        ])
+
+        chunked = await calendar_server.get_events(start_date="2024-01-01", end_date="2024-06-30")
+
+        calendar_server._on_store_changed()
+        monkeypatch.setattr(server_module, "_CHUNK_THRESHOLD", timedelta(days=365))
+        single = await calendar_server.get_events(start_date="2024-01-01", end_date="2024-06-30")
+
+        titles = [event['title'] for event in chunked]
+        assert titles == [f"Event {start:%m-%d}" for start in sorted(starts)]
+        assert titles == [event['title'] for event in single]
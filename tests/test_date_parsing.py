@@ -9,21 +9,15 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from mac_calendar_mcp.server import CalendarServer
-from tests.mocks.mock_eventkit import MockEKEventStore, MockNSDate
-
 
 class TestDateParsing:
     """Test date parsing and normalization in get_events."""
 
     @pytest.mark.asyncio
     @freeze_time("2024-12-25 10:00:00")
-    async def test_parse_iso_date_only(self):
+    async def test_parse_iso_date_only(self, empty_calendar_server):
         """Test parsing date-only ISO string → start of day."""
-        server = CalendarServer()
-        server.access_granted = True
-        server.event_store = MockEKEventStore()
-        server.event_store.set_authorized(True)
+        server = empty_calendar_server
 
         # Date-only input should become midnight
         events = await server.get_events(start_date="2024-12-25")
@@ -33,12 +27,9 @@ class TestDateParsing:
         assert server.event_store._events is not None
 
     @pytest.mark.asyncio
-    async def test_parse_iso_datetime(self):
+    async def test_parse_iso_datetime(self, empty_calendar_server):
         """Test parsing ISO datetime string with time → exact time."""
-        server = CalendarServer()
-        server.access_granted = True
-        server.event_store = MockEKEventStore()
-        server.event_store.set_authorized(True)
+        server = empty_calendar_server
 
         # DateTime input should preserve exact time
         events = await server.get_events(
@@ -50,12 +41,9 @@ class TestDateParsing:
 
     @pytest.mark.asyncio
     @freeze_time("2024-12-25 10:00:00")
-    async def test_default_start_date(self):
+    async def test_default_start_date(self, empty_calendar_server):
         """Test None start_date → today at midnight."""
-        server = CalendarServer()
-        server.access_granted = True
-        server.event_store = MockEKEventStore()
-        server.event_store.set_authorized(True)
+        server = empty_calendar_server
 
         events = await server.get_events(start_date=None)
         
@@ -63,12 +51,9 @@ class TestDateParsing:
         assert events is not None
 
     @pytest.mark.asyncio
-    async def test_default_end_date(self):
+    async def test_default_end_date(self, empty_calendar_server):
         """Test None end_date → start + days_ahead."""
-        server = CalendarServer()
-        server.access_granted = True
-        server.event_store = MockEKEventStore()
-        server.event_store.set_authorized(True)
+        server = empty_calendar_server
 
         events = await server.get_events(
             start_date="2024-12-25",
@@ -80,12 +65,9 @@ class TestDateParsing:
         assert events is not None
 
     @pytest.mark.asyncio
-    async def test_same_date_start_end(self):
+    async def test_same_date_start_end(self, empty_calendar_server):
         """Test same date for start and end → 00:00:00 to 23:59:59."""
-        server = CalendarServer()
-        server.access_granted = True
-        server.event_store = MockEKEventStore()
-        server.event_store.set_authorized(True)
+        server = empty_calendar_server
 
         events = await server.get_events(
             start_date="2024-12-25",
@@ -96,12 +78,9 @@ class TestDateParsing:
         assert events is not None
 
     @pytest.mark.asyncio
-    async def test_end_date_without_time(self):
+    async def test_end_date_without_time(self, empty_calendar_server):
         """Test end_date without time → 23:59:59.999999."""
-        server = CalendarServer()
-        server.access_granted = True
-        server.event_store = MockEKEventStore()
-        server.event_store.set_authorized(True)
+        server = empty_calendar_server
 
         events = await server.get_events(
             start_date="2024-12-25T09:00:00",
@@ -112,12 +91,9 @@ class TestDateParsing:
         assert events is not None
 
     @pytest.mark.asyncio
-    async def test_days_ahead_parameter(self):
+    async def test_days_ahead_parameter(self, empty_calendar_server):
         """Test days_ahead=14 → 14 days from start."""
-        server = CalendarServer()
-        server.access_granted = True
-        server.event_store = MockEKEventStore()
-        server.event_store.set_authorized(True)
+        server = empty_calendar_server
 
         events = await server.get_events(
             start_date="2024-12-25",
@@ -127,12 +103,9 @@ class TestDateParsing:
         assert events is not None
 
     @pytest.mark.asyncio
-    async def test_microsecond_precision(self):
+    async def test_microsecond_precision(self, empty_calendar_server):
         """Test that end_date includes .999999 microseconds."""
-        server = CalendarServer()
-        server.access_granted = True
-        server.event_store = MockEKEventStore()
-        server.event_store.set_authorized(True)
+        server = empty_calendar_server
 
         events = await server.get_events(
             start_date="2024-12-25"
@@ -142,22 +115,26 @@ class TestDateParsing:
         assert events is not None
 
     @pytest.mark.asyncio
-    async def test_invalid_iso_format(self):
+    async def test_invalid_iso_format(self, empty_calendar_server):
         """Test malformed date string → error."""
-        server = CalendarServer()
-        server.access_granted = True
-        server.event_store = MockEKEventStore()
+        server = empty_calendar_server
 
         with pytest.raises((ValueError, TypeError)):
             await server.get_events(start_date="not-a-date")
 
+    def test_parsed_dates_are_memoized(self):
+        """Test repeated date strings share one parse while bad ones keep raising."""
+        from mac_calendar_mcp.server import _parse_iso
+
+        assert _parse_iso("2024-12-25") is _parse_iso("2024-12-25")
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                _parse_iso("not-a-date")
+
     @pytest.mark.asyncio
-    async def test_date_before_1970(self):
+    async def test_date_before_1970(self, empty_calendar_server):
         """Test Unix epoch boundary (before 1970)."""
-        server = CalendarServer()
-        server.access_granted = True
-        server.event_store = MockEKEventStore()
-        server.event_store.set_authorized(True)
+        server = empty_calendar_server
 
         # Date before Unix epoch
         events = await server.get_events(start_date="1969-12-31")
@@ -165,12 +142,9 @@ class TestDateParsing:
         assert events is not None
 
     @pytest.mark.asyncio
-    async def test_date_after_2038(self):
+    async def test_date_after_2038(self, empty_calendar_server):
         """Test Y2038 boundary."""
-        server = CalendarServer()
-        server.access_granted = True
-        server.event_store = MockEKEventStore()
-        server.event_store.set_authorized(True)
+        server = empty_calendar_server
 
         # Date after Y2038
         events = await server.get_events(start_date="2040-01-01")
@@ -178,12 +152,9 @@ class TestDateParsing:
         assert events is not None
 
     @pytest.mark.asyncio
-    async def test_nsdate_conversion(self):
+    async def test_nsdate_conversion(self, empty_calendar_server):
         """Test Python datetime → NSDate → timestamp conversion."""
-        server = CalendarServer()
-        server.access_granted = True
-        server.event_store = MockEKEventStore()
-        server.event_store.set_authorized(True)
+        server = empty_calendar_server
 
         events = await server.get_events(
             start_date="2024-12-25T14:30:45"
@@ -193,12 +164,9 @@ class TestDateParsing:
         assert events is not None
 
     @pytest.mark.asyncio
-    async def test_timezone_naive_handling(self):
+    async def test_timezone_naive_handling(self, empty_calendar_server):
         """Test dates without timezone info."""
-        server = CalendarServer()
-        server.access_granted = True
-        server.event_store = MockEKEventStore()
-        server.event_store.set_authorized(True)
+        server = empty_calendar_server
 
         # ISO format without timezone
         events = await server.get_events(
@@ -208,12 +176,9 @@ class TestDateParsing:
         assert events is not None
 
     @pytest.mark.asyncio
-    async def test_date_range_calculation(self):
+    async def test_date_range_calculation(self, empty_calendar_server):
         """Test that date range is calculated correctly."""
-        server = CalendarServer()
-        server.access_granted = True
-        server.event_store = MockEKEventStore()
-        server.event_store.set_authorized(True)
+        server = empty_calendar_server
 
         start = datetime(2024, 12, 25, 0, 0, 0)
         end = start + timedelta(days=7)
@@ -1,7 +1,9 @@
 """Tests for enhanced event fields and attendee filtering."""
 
+import re
 import pytest
 from datetime import datetime, timedelta
+import mac_calendar_mcp.server as server_module
 from mac_calendar_mcp.server import CalendarServer
 from tests.mocks.mock_eventkit import (
     MockEKEventStore,
@@ -17,21 +19,40 @@ from tests.mocks.mock_eventkit import (
     EKEventAvailabilityFree,
 )
 
+# Under pytest-xdist --dist=loadgroup, keep this module on one worker so the
+# module-scoped calendar_server is built once rather than once per worker
+pytestmark = pytest.mark.xdist_group("enhanced_events")
 
-@pytest.fixture
-def calendar_server(monkeypatch):
-    """Create a CalendarServer instance with mocked EventKit."""
-    # Mock the EventKit classes
-    monkeypatch.setattr("mac_calendar_mcp.server.EKEventStore", MockEKEventStore)
+# Fixed instants keep every test on the same day whenever the suite runs
+START = datetime(2024, 6, 15, 12, 0, 0)
+DATE_STR = START.strftime("%Y-%m-%d")
 
-    server = CalendarServer()
-    server.event_store.set_authorized(True)
+
+@pytest.fixture(scope="module")
+def calendar_server():
+    """Create a CalendarServer instance with mocked EventKit, shared by the module."""
+    # The monkeypatch fixture is function-scoped, and the patch is only
+    # needed while the server builds its store
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        # Mock the EventKit classes
+        monkeypatch.setattr("mac_calendar_mcp.server.EKEventStore", MockEKEventStore)
+
+        server = CalendarServer()
 
     # Add a test calendar
     test_calendar = MockEKCalendar("Test Calendar")
     server.event_store.add_calendar(test_calendar)
 
-    return server, test_calendar
+    yield server, test_calendar
+    server.close()
+
+
+@pytest.fixture(autouse=True)
+def clean_store(calendar_server):
+    """Start each test with no events and no cached query results."""
+    server, _ = calendar_server
+    server.event_store.clear_events()
+    server._on_store_changed()
 
 
 @pytest.mark.asyncio
@@ -40,7 +61,7 @@ async def test_event_with_location(calendar_server):
     server, test_calendar = calendar_server
 
     # Create event with location
-    start = datetime.now()
+    start = START
     end = start + timedelta(hours=1)
     event = MockEKEvent(
         title="Meeting at Office",
@@ -53,8 +74,8 @@ async def test_event_with_location(calendar_server):
 
     # Get events
     events = await server.get_events(
-        start_date=start.strftime("%Y-%m-%d"),
-        end_date=start.strftime("%Y-%m-%d"),
+        start_date=DATE_STR,
+        end_date=DATE_STR,
     )
 
     assert len(events) == 1
@@ -66,7 +87,7 @@ async def test_event_without_location(calendar_server):
     """Test that event without location returns empty string."""
     server, test_calendar = calendar_server
 
-    start = datetime.now()
+    start = START
     end = start + timedelta(hours=1)
     event = MockEKEvent(
         title="Virtual Meeting",
@@ -78,8 +99,8 @@ async def test_event_without_location(calendar_server):
     server.event_store.add_event(event)
 
     events = await server.get_events(
-        start_date=start.strftime("%Y-%m-%d"),
-        end_date=start.strftime("%Y-%m-%d"),
+        start_date=DATE_STR,
+        end_date=DATE_STR,
     )
 
     assert len(events) == 1
@@ -91,7 +112,7 @@ async def test_event_with_url(calendar_server):
     """Test that meeting URL is extracted from URL field."""
     server, test_calendar = calendar_server
 
-    start = datetime.now()
+    start = START
     end = start + timedelta(hours=1)
     event = MockEKEvent(
         title="Zoom Meeting",
@@ -103,8 +124,8 @@ async def test_event_with_url(calendar_server):
     server.event_store.add_event(event)
 
     events = await server.get_events(
-        start_date=start.strftime("%Y-%m-%d"),
-        end_date=start.strftime("%Y-%m-%d"),
+        start_date=DATE_STR,
+        end_date=DATE_STR,
     )
 
     assert len(events) == 1
@@ -116,7 +137,7 @@ async def test_event_with_url_in_notes(calendar_server):
     """Test that meeting URL is extracted from notes."""
     server, test_calendar = calendar_server
 
-    start = datetime.now()
+    start = START
     end = start + timedelta(hours=1)
     event = MockEKEvent(
         title="Meeting",
@@ -128,8 +149,8 @@ async def test_event_with_url_in_notes(calendar_server):
     server.event_store.add_event(event)
 
     events = await server.get_events(
-        start_date=start.strftime("%Y-%m-%d"),
-        end_date=start.strftime("%Y-%m-%d"),
+        start_date=DATE_STR,
+        end_date=DATE_STR,
     )
 
     assert len(events) == 1
@@ -141,7 +162,7 @@ async def test_event_without_url(calendar_server):
     """Test that event without URL returns None."""
     server, test_calendar = calendar_server
 
-    start = datetime.now()
+    start = START
     end = start + timedelta(hours=1)
     event = MockEKEvent(
         title="In-person Meeting",
@@ -152,14 +173,75 @@ async def test_event_without_url(calendar_server):
     server.event_store.add_event(event)
 
     events = await server.get_events(
-        start_date=start.strftime("%Y-%m-%d"),
-        end_date=start.strftime("%Y-%m-%d"),
+        start_date=DATE_STR,
+        end_date=DATE_STR,
     )
 
     assert len(events) == 1
     assert events[0]["meeting_url"] is None
 
 
+@pytest.mark.asyncio
+async def test_event_with_teams_url_in_notes(calendar_server):
+    """Test that a Teams link is found case-insensitively inside longer notes."""
+    server, test_calendar = calendar_server
+
+    start = datetime(2024, 12, 20, 14, 0, 0)
+    event = MockEKEvent(
+        title="Vendor Call",
+        start=start,
+        end=start + timedelta(hours=1),
+        calendar=test_calendar,
+        notes="Agenda attached.\nJoin: HTTPS://Teams.Microsoft.com/l/meetup-join/19%3a abc",
+    )
+    server.event_store.add_event(event)
+
+    events = await server.get_events(start_date="2024-12-20", end_date="2024-12-20")
+
+    assert len(events) == 1
+    assert events[0]["meeting_url"] == "HTTPS://Teams.Microsoft.com/l/meetup-join/19%3a"
+
+
+@pytest.mark.asyncio
+async def test_url_extraction_is_precompiled(calendar_server, monkeypatch):
+    """Test that scanning notes for meeting URLs compiles no regex per query."""
+    server, test_calendar = calendar_server
+
+    server.event_store.bulk_add_events([
+        MockEKEvent(
+            f"Meeting {i}", START, START + timedelta(hours=1), test_calendar,
+            notes=f"Dial in: https://zoom.us/j/{i}",
+        )
+        for i in range(5)
+    ])
+
+    # Every notes scan should go through the module's precompiled pattern,
+    # and nothing on the query path should compile a new one
+    searched = []
+    pattern = server_module._MEETING_URL_RE
+
+    class RecordingPattern:
+        def search(self, text):
+            searched.append(text)
+            return pattern.search(text)
+
+    compiles = []
+    real_compile = re.compile
+
+    def counting_compile(*args, **kwargs):
+        compiles.append(args)
+        return real_compile(*args, **kwargs)
+
+    monkeypatch.setattr(server_module, "_MEETING_URL_RE", RecordingPattern())
+    monkeypatch.setattr(re, "compile", counting_compile)
+
+    events = await server.get_events(start_date=DATE_STR, end_date=DATE_STR)
+
+    assert [e["meeting_url"] for e in events] == [f"https://zoom.us/j/{i}" for i in range(5)]
+    assert len(searched) == 5
+    assert compiles == []
+
+
 @pytest.mark.asyncio
 async def test_detailed_attendees_list(calendar_server):
     """Test that detailed attendees list is returned."""
@@ -172,7 +254,7 @@ async def test_detailed_attendees_list(calendar_server):
         MockEKParticipant("Current User", "me@example.com", EKParticipantStatusTentative, True),
     ]
 
-    start = datetime.now()
+    start = START
     end = start + timedelta(hours=1)
     event = MockEKEvent(
         title="Team Meeting",
@@ -184,8 +266,8 @@ async def test_detailed_attendees_list(calendar_server):
     server.event_store.add_event(event)
 
     events = await server.get_events(
-        start_date=start.strftime("%Y-%m-%d"),
-        end_date=start.strftime("%Y-%m-%d"),
+        start_date=DATE_STR,
+        end_date=DATE_STR,
     )
 
     assert len(events) == 1
@@ -213,6 +295,36 @@ async def test_detailed_attendees_list(calendar_server):
     assert current["is_current_user"] is True
 
 
+@pytest.mark.asyncio
+async def test_events_without_attendee_details(calendar_server):
+    """Test include_attendees=False keeps the count and the user's RSVP only."""
+    server, test_calendar = calendar_server
+
+    attendees = [
+        MockEKParticipant("Alice", "alice@example.com", EKParticipantStatusAccepted, False),
+        MockEKParticipant("Current User", "me@example.com", EKParticipantStatusDeclined, True),
+    ]
+    start = datetime(2024, 12, 20, 9, 0, 0)
+    server.event_store.add_event(MockEKEvent(
+        title="Planning",
+        start=start,
+        end=start + timedelta(hours=1),
+        calendar=test_calendar,
+        attendees=attendees,
+    ))
+
+    events = await server.get_events(
+        start_date="2024-12-20",
+        end_date="2024-12-20",
+        include_attendees=False,
+    )
+
+    assert len(events) == 1
+    assert events[0]["attendees"] == []
+    assert events[0]["attendee_count"] == 2
+    assert events[0]["user_rsvp_status"] == "Declined"
+
+
 @pytest.mark.asyncio
 async def test_filter_by_attendee_name_exact(calendar_server):
     """Test filtering by exact attendee name."""
@@ -220,20 +332,19 @@ async def test_filter_by_attendee_name_exact(calendar_server):
 
     # Event with Alice
     attendees1 = [MockEKParticipant("Alice", "alice@example.com", EKParticipantStatusAccepted)]
-    start = datetime.now()
+    start = START
     end = start + timedelta(hours=1)
     event1 = MockEKEvent("Meeting 1", start, end, test_calendar, attendees=attendees1)
-    server.event_store.add_event(event1)
 
     # Event with Bob
     attendees2 = [MockEKParticipant("Bob", "bob@example.com", EKParticipantStatusAccepted)]
     event2 = MockEKEvent("Meeting 2", start, end, test_calendar, attendees=attendees2)
-    server.event_store.add_event(event2)
+    server.event_store.bulk_add_events([event1, event2])
 
     # Filter by Alice
     events = await server.get_events(
-        start_date=start.strftime("%Y-%m-%d"),
-        end_date=start.strftime("%Y-%m-%d"),
+        start_date=DATE_STR,
+        end_date=DATE_STR,
         attendee_name_pattern="Alice",
     )
 
@@ -247,15 +358,15 @@ async def test_filter_by_attendee_name_partial(calendar_server):
     server, test_calendar = calendar_server
 
     attendees = [MockEKParticipant("Alicia Smith", "alicia@example.com", EKParticipantStatusAccepted)]
-    start = datetime.now()
+    start = START
     end = start + timedelta(hours=1)
     event = MockEKEvent("Meeting", start, end, test_calendar, attendees=attendees)
     server.event_store.add_event(event)
 
     # Filter by partial name (case-insensitive)
     events = await server.get_events(
-        start_date=start.strftime("%Y-%m-%d"),
-        end_date=start.strftime("%Y-%m-%d"),
+        start_date=DATE_STR,
+        end_date=DATE_STR,
         attendee_name_pattern="ali",
     )
 
@@ -269,15 +380,15 @@ async def test_filter_by_attendee_email(calendar_server):
     server, test_calendar = calendar_server
 
     attendees = [MockEKParticipant("John Doe", "john@company.com", EKParticipantStatusAccepted)]
-    start = datetime.now()
+    start = START
     end = start + timedelta(hours=1)
     event = MockEKEvent("Meeting", start, end, test_calendar, attendees=attendees)
     server.event_store.add_event(event)
 
     # Filter by email domain
     events = await server.get_events(
-        start_date=start.strftime("%Y-%m-%d"),
-        end_date=start.strftime("%Y-%m-%d"),
+        start_date=DATE_STR,
+        end_date=DATE_STR,
         attendee_name_pattern="company.com",
     )
 
@@ -292,20 +403,19 @@ async def test_filter_by_attendee_status_single(calendar_server):
 
     # Event with accepted attendee
     attendees1 = [MockEKParticipant("Alice", "alice@example.com", EKParticipantStatusAccepted)]
-    start = datetime.now()
+    start = START
     end = start + timedelta(hours=1)
     event1 = MockEKEvent("Meeting 1", start, end, test_calendar, attendees=attendees1)
-    server.event_store.add_event(event1)
 
     # Event with declined attendee
     attendees2 = [MockEKParticipant("Bob", "bob@example.com", EKParticipantStatusDeclined)]
     event2 = MockEKEvent("Meeting 2", start, end, test_calendar, attendees=attendees2)
-    server.event_store.add_event(event2)
+    server.event_store.bulk_add_events([event1, event2])
 
     # Filter by Accepted status
     events = await server.get_events(
-        start_date=start.strftime("%Y-%m-%d"),
-        end_date=start.strftime("%Y-%m-%d"),
+        start_date=DATE_STR,
+        end_date=DATE_STR,
         attendee_status_filter=["Accepted"],
     )
 
@@ -320,25 +430,23 @@ async def test_filter_by_attendee_status_multiple(calendar_server):
 
     # Event with accepted attendee
     attendees1 = [MockEKParticipant("Alice", "alice@example.com", EKParticipantStatusAccepted)]
-    start = datetime.now()
+    start = START
     end = start + timedelta(hours=1)
     event1 = MockEKEvent("Meeting 1", start, end, test_calendar, attendees=attendees1)
-    server.event_store.add_event(event1)
 
     # Event with tentative attendee
     attendees2 = [MockEKParticipant("Bob", "bob@example.com", EKParticipantStatusTentative)]
     event2 = MockEKEvent("Meeting 2", start, end, test_calendar, attendees=attendees2)
-    server.event_store.add_event(event2)
 
     # Event with declined attendee
     attendees3 = [MockEKParticipant("Charlie", "charlie@example.com", EKParticipantStatusDeclined)]
     event3 = MockEKEvent("Meeting 3", start, end, test_calendar, attendees=attendees3)
-    server.event_store.add_event(event3)
+    server.event_store.bulk_add_events([event1, event2, event3])
 
     # Filter by Accepted or Tentative
     events = await server.get_events(
-        start_date=start.strftime("%Y-%m-%d"),
-        end_date=start.strftime("%Y-%m-%d"),
+        start_date=DATE_STR,
+        end_date=DATE_STR,
         attendee_status_filter=["Accepted", "Tentative"],
     )
 
@@ -354,20 +462,19 @@ async def test_filter_by_name_and_status(calendar_server):
 
     # Event with Alice (accepted)
     attendees1 = [MockEKParticipant("Alice", "alice@example.com", EKParticipantStatusAccepted)]
-    start = datetime.now()
+    start = START
     end = start + timedelta(hours=1)
     event1 = MockEKEvent("Meeting 1", start, end, test_calendar, attendees=attendees1)
-    server.event_store.add_event(event1)
 
     # Event with Alice (declined) - different event
     attendees2 = [MockEKParticipant("Alice", "alice@example.com", EKParticipantStatusDeclined)]
     start2 = start + timedelta(days=1)
     event2 = MockEKEvent("Meeting 2", start2, start2 + timedelta(hours=1), test_calendar, attendees=attendees2)
-    server.event_store.add_event(event2)
+    server.event_store.bulk_add_events([event1, event2])
 
     # Filter by Alice + Accepted
     events = await server.get_events(
-        start_date=start.strftime("%Y-%m-%d"),
+        start_date=DATE_STR,
         end_date=start2.strftime("%Y-%m-%d"),
         attendee_name_pattern="alice",
         attendee_status_filter=["Accepted"],
@@ -382,20 +489,19 @@ async def test_filter_all_day_only(calendar_server):
     """Test filtering for all-day events only."""
     server, test_calendar = calendar_server
 
-    start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    start = START.replace(hour=0)
 
     # All-day event
     event1 = MockEKEvent("All Day Event", start, start + timedelta(hours=1), test_calendar, is_all_day=True)
-    server.event_store.add_event(event1)
 
     # Regular timed event
     event2 = MockEKEvent("Timed Event", start, start + timedelta(hours=1), test_calendar, is_all_day=False)
-    server.event_store.add_event(event2)
+    server.event_store.bulk_add_events([event1, event2])
 
     # Filter for all-day only
     events = await server.get_events(
-        start_date=start.strftime("%Y-%m-%d"),
-        end_date=start.strftime("%Y-%m-%d"),
+        start_date=DATE_STR,
+        end_date=DATE_STR,
         all_day_only=True,
     )
 
@@ -409,21 +515,20 @@ async def test_filter_busy_only(calendar_server):
     """Test filtering for busy events only."""
     server, test_calendar = calendar_server
 
-    start = datetime.now()
+    start = START
     end = start + timedelta(hours=1)
 
     # Busy event
     event1 = MockEKEvent("Busy Meeting", start, end, test_calendar, availability=EKEventAvailabilityBusy)
-    server.event_store.add_event(event1)
 
     # Free event
     event2 = MockEKEvent("Free Time", start, end, test_calendar, availability=EKEventAvailabilityFree)
-    server.event_store.add_event(event2)
+    server.event_store.bulk_add_events([event1, event2])
 
     # Filter for busy only
     events = await server.get_events(
-        start_date=start.strftime("%Y-%m-%d"),
-        end_date=start.strftime("%Y-%m-%d"),
+        start_date=DATE_STR,
+        end_date=DATE_STR,
         busy_only=True,
     )
 
@@ -14,6 +14,17 @@ class TestMCPIntegration:
         assert isinstance(tools, list)
         assert len(tools) == 9  # Updated: now includes 9 tools (get_calendar_events, get_events, list_calendars, get_reminders, search, get_today_summary, get_current_time, convert_time, list_timezones)
 
+    async def test_list_tools_is_built_once(self):
+        """Test list_tools returns the same prebuilt list on every call"""
+        from mac_calendar_mcp.server import list_tools
+
+        first = await list_tools()
+        assert await list_tools() is first
+
+        events = next(t for t in first if t.name == "get_calendar_events")
+        alias = next(t for t in first if t.name == "get_events")
+        assert alias.inputSchema == events.inputSchema
+
     async def test_get_calendar_events_tool_schema(self):
         """Test get_calendar_events tool has correct schema"""
         from mac_calendar_mcp.server import list_tools
@@ -70,16 +81,115 @@ class TestMCPIntegration:
         data = json.loads(text)
         assert isinstance(data, list)
 
-    async def test_json_indent_formatting(self):
-        """Test JSON responses are indented for readability"""
+    async def test_json_compact_by_default(self):
+        """Test JSON responses are compact unless pretty output is enabled"""
         from mac_calendar_mcp.server import call_tool
 
         result = await call_tool("get_calendar_events", {"start_date": "2024-12-15", "end_date": "2024-12-25"})
         text = result[0].text
 
-        # Should have indentation (multiple lines) when there's data
-        if text != "[]":  # Non-empty response should be indented
-            assert '\n' in text or len(text) < 10
+        assert '\n' not in text
+
+    async def test_json_indent_formatting(self, monkeypatch):
+        """Test JSON responses are indented for readability when MCP_PRETTY_JSON is set"""
+        import mac_calendar_mcp.server as server
+
+        monkeypatch.setattr(server, "_PRETTY_JSON", True)
+        text = server._to_json([{"title": "Standup"}])
+
+        assert '\n' in text
+        assert json.loads(text) == [{"title": "Standup"}]
+
+    async def test_json_encoding_round_trips(self):
+        """Test the fast JSON encoder produces the same data as stdlib json"""
+        from mac_calendar_mcp.server import _to_json
+
+        payload = [{"title": "Café ☕", "all_day": False, "attendee_count": 2, "meeting_url": None}]
+        assert json.loads(_to_json(payload)) == payload
+        assert _to_json({1: "one"}) == json.dumps({1: "one"}, separators=(",", ":"))
+        assert _to_json([]) == json.dumps([])
+        assert _to_json({}) == json.dumps({})
+
+    async def test_json_encodes_str_subclasses(self):
+        """Test bridged string values (str subclasses) encode like plain strings"""
+        from mac_calendar_mcp.server import _to_json
+
+        class BridgedString(str):
+            pass
+
+        assert _to_json([{"title": BridgedString("Standup")}]) == _to_json([{"title": "Standup"}])
+
+    async def test_ndjson_for_large_results(self, monkeypatch):
+        """Test list results past the NDJSON threshold are sent one object per line"""
+        import mac_calendar_mcp.server as server
+
+        payload = [{"title": "Standup"}, {"title": "Review"}]
+        assert [json.loads(line) for line in server._to_ndjson(payload).split("\n")] == payload
+
+        async def fake_results(**kwargs):
+            return payload
+
+        monkeypatch.setattr(server, "_NDJSON_MIN_ITEMS", 1)
+        monkeypatch.setattr(server.calendar, "get_current_time", fake_results)
+        monkeypatch.setattr(server.calendar, "search", fake_results)
+
+        # Only the event, reminder and search tools switch format
+        result = await server.call_tool("get_current_time", {})
+        assert json.loads(result[0].text) == payload
+
+        result = await server.call_tool("search", {"query": "standup"})
+        assert result[0].text == server._to_ndjson(payload)
+
+    async def test_invalid_integer_setting_falls_back(self, monkeypatch, caplog):
+        """Test a non-integer MCP_NDJSON_MIN_ITEMS is ignored with a warning instead of failing"""
+        from mac_calendar_mcp.server import _env_int
+
+        monkeypatch.setenv("MCP_NDJSON_MIN_ITEMS", "yes")
+        assert _env_int("MCP_NDJSON_MIN_ITEMS") == 0
+        assert "MCP_NDJSON_MIN_ITEMS" in caplog.text
+
+        monkeypatch.setenv("MCP_NDJSON_MIN_ITEMS", "25")
+        assert _env_int("MCP_NDJSON_MIN_ITEMS") == 25
+
+    async def test_timezone_list_reply_is_cached(self, monkeypatch):
+        """Test list_timezones replies are encoded once per region"""
+        import mac_calendar_mcp.server as server
+
+        monkeypatch.setattr(server, "_TIMEZONES_TEXT", {})
+        list_timezones = server.calendar.list_timezones
+        calls = []
+
+        async def counting_list(region=None):
+            calls.append(region)
+            return await list_timezones(region=region)
+
+        monkeypatch.setattr(server.calendar, "list_timezones", counting_list)
+
+        first = await server.call_tool("list_timezones", {"region": "Europe"})
+        second = await server.call_tool("list_timezones", {"region": "Europe"})
+        assert calls == ["Europe"]
+        assert second[0].text == first[0].text
+        assert "Europe/London" in json.loads(first[0].text)
+
+        # Unknown regions are answered but not stored
+        await server.call_tool("list_timezones", {"region": "Atlantis"})
+        await server.call_tool("list_timezones", {"region": "Atlantis"})
+        assert calls == ["Europe", "Atlantis", "Atlantis"]
+
+    async def test_large_results_encode_inline(self, monkeypatch):
+        """Test large tool results are encoded inline, exactly as _to_json encodes them"""
+        import mac_calendar_mcp.server as server
+
+        payload = [{"title": f"Event {i}"} for i in range(200)]
+
+        async def fake_search(**kwargs):
+            return payload
+
+        monkeypatch.setattr(server, "_NDJSON_MIN_ITEMS", 0)
+        monkeypatch.setattr(server.calendar, "search", fake_search)
+
+        result = await server.call_tool("search", {"query": "event"})
+        assert result[0].text == server._to_json(payload)
 
     async def test_unknown_tool_raises_error(self):
         """Test calling unknown tool raises ValueError"""
@@ -34,8 +34,6 @@ class TestPermissions:
         """Test successful permission grant"""
         from mac_calendar_mcp.server import CalendarServer
 
-        mock_event_store.set_authorized(True)
-
         server = CalendarServer()
         server.event_store = mock_event_store
         result = await server.request_access()
@@ -46,7 +44,7 @@ class TestPermissions:
         from mac_calendar_mcp.server import CalendarServer
         from tests.mocks.mock_eventkit import MockEKEventStore
 
-        mock_event_store.set_authorized(False)
+        mock_event_store.set_denied()
 
         # Patch EKEventStore in the server module (not EventKit module)
         monkeypatch.setattr('mac_calendar_mcp.server.EKEventStore', MockEKEventStore)
@@ -61,8 +59,6 @@ class TestPermissions:
         # The mock completes quickly, but test the timeout exists
         from mac_calendar_mcp.server import CalendarServer
 
-        mock_event_store.set_authorized(True)
-
         server = CalendarServer()
         server.event_store = mock_event_store
         result = await server.request_access()
@@ -95,7 +91,7 @@ class TestPermissions:
         from mac_calendar_mcp.server import CalendarServer
         from tests.mocks.mock_eventkit import MockEKEventStore
 
-        mock_event_store.set_authorized(False)
+        mock_event_store.set_denied()
 
         # Patch EKEventStore in the server module (not EventKit module)
         monkeypatch.setattr('mac_calendar_mcp.server.EKEventStore', MockEKEventStore)
@@ -119,7 +115,6 @@ class TestPermissions:
         """Test that get_calendars also requests access if needed"""
         from mac_calendar_mcp.server import CalendarServer
 
-        mock_event_store.set_authorized(True)
         for cal in mock_calendars:
             mock_event_store.add_calendar(cal)
 
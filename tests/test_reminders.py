@@ -22,7 +22,6 @@ def calendar_server(monkeypatch):
     monkeypatch.setattr("mac_calendar_mcp.server.EKEventStore", MockEKEventStore)
 
     server = CalendarServer()
-    server.event_store.set_authorized(True)
 
     # Add a test calendar
     test_calendar = MockEKCalendar("Reminders")
@@ -90,6 +89,25 @@ async def test_reminder_date_range_filter(calendar_server):
     assert reminders[0]["title"] == "Today task"
 
 
+@pytest.mark.asyncio
+async def test_date_only_reminder_range_filter(calendar_server):
+    """Test date-only reminders (undefined time components) are range filtered."""
+    from Foundation import NSDateComponentUndefined
+
+    server, test_calendar = calendar_server
+
+    undefined = NSDateComponentUndefined
+    due_in_range = MockEKDateComponents(2024, 12, 20, undefined, undefined, undefined)
+    due_later = MockEKDateComponents(2024, 12, 28, undefined, undefined, undefined)
+    server.event_store.add_reminder(MockEKReminder("Pay rent", test_calendar, due_in_range))
+    server.event_store.add_reminder(MockEKReminder("Renew passport", test_calendar, due_later))
+
+    reminders = await server.get_reminders(start_date="2024-12-20", end_date="2024-12-20")
+
+    assert [r["title"] for r in reminders] == ["Pay rent"]
+    assert reminders[0]["due_date_str"] == "2024-12-20T00:00:00"
+
+
 @pytest.mark.asyncio
 async def test_reminder_calendar_filter(calendar_server):
     """Test filtering reminders by calendar name."""
@@ -117,7 +117,6 @@ class TestRSVPStatus:
         server = CalendarServer()
         server.access_granted = True
         server.event_store = MockEKEventStore()
-        server.event_store.set_authorized(True)
         
         # Create calendar
         calendar = MockEKCalendar(title="Work")
@@ -148,7 +147,6 @@ class TestRSVPStatus:
         server = CalendarServer()
         server.access_granted = True
         server.event_store = MockEKEventStore()
-        server.event_store.set_authorized(True)
         
         # Create calendar
         calendar = MockEKCalendar(title="Work")
@@ -7,9 +7,11 @@ from tests.mocks.mock_eventkit import (
     MockEKEventStore,
     MockEKCalendar,
     MockEKEvent,
+    MockEKParticipant,
     MockEKReminder,
     MockEKDateComponents,
     EKAuthorizationStatusAuthorized,
+    EKParticipantStatusAccepted,
 )
 
 
@@ -19,7 +21,6 @@ def calendar_server(monkeypatch):
     monkeypatch.setattr("mac_calendar_mcp.server.EKEventStore", MockEKEventStore)
 
     server = CalendarServer()
-    server.event_store.set_authorized(True)
 
     # Add test calendars
     event_calendar = MockEKCalendar("Calendar")
@@ -41,8 +42,7 @@ async def test_search_in_event_title(calendar_server):
     # Create events with different titles
     event1 = MockEKEvent("Team Meeting", start, end, event_calendar)
     event2 = MockEKEvent("Project Review", start, end, event_calendar)
-    server.event_store.add_event(event1)
-    server.event_store.add_event(event2)
+    server.event_store.bulk_add_events([event1, event2])
 
     # Search for "meeting"
     results = await server.search(
@@ -238,11 +238,10 @@ async def test_search_with_date_range(calendar_server):
 
     # Create event today with "meeting" in title
     event1 = MockEKEvent("Meeting today", today, today + timedelta(hours=1), event_calendar)
-    server.event_store.add_event(event1)
 
     # Create event next month with "meeting" in title
     event2 = MockEKEvent("Meeting next month", next_month, next_month + timedelta(hours=1), event_calendar)
-    server.event_store.add_event(event2)
+    server.event_store.bulk_add_events([event1, event2])
 
     # Search only in today's range
     results = await server.search(
@@ -254,3 +253,22 @@ async def test_search_with_date_range(calendar_server):
 
     assert len(results) == 1
     assert results[0]["title"] == "Meeting today"
+
+
+@pytest.mark.asyncio
+async def test_search_includes_attendees(calendar_server):
+    """Test matching events carry attendee details unless include_attendees is False."""
+    server, event_calendar, reminder_calendar = calendar_server
+
+    start = datetime.now()
+    attendees = [MockEKParticipant("Alice", "alice@example.com", EKParticipantStatusAccepted)]
+    server.event_store.add_event(
+        MockEKEvent("Design Review", start, start + timedelta(hours=1), event_calendar, attendees=attendees)
+    )
+
+    results = await server.search(query="design", search_reminders=False)
+    assert [a["name"] for a in results[0]["attendees"]] == ["Alice"]
+
+    results = await server.search(query="design", search_reminders=False, include_attendees=False)
+    assert results[0]["attendees"] == []
+    assert results[0]["attendee_count"] == 1
@@ -12,7 +12,6 @@ def calendar_server(monkeypatch):
     monkeypatch.setattr("mac_calendar_mcp.server.EKEventStore", MockEKEventStore)
 
     server = CalendarServer()
-    server.event_store.set_authorized(True)
 
     return server
 
@@ -95,6 +94,37 @@ async def test_convert_time_with_timezone_aware(calendar_server):
     assert result["to_timezone"] == "Asia/Tokyo"
 
 
+@pytest.mark.asyncio
+async def test_convert_time_applies_daylight_saving(calendar_server):
+    """Test repeated conversions with the memoized zone use the right DST offset."""
+    server = calendar_server
+
+    summer = await server.convert_time(
+        datetime_str="2024-07-01T12:00:00",
+        from_timezone="America/New_York",
+        to_timezone="UTC",
+    )
+    winter = await server.convert_time(
+        datetime_str="2024-01-15T12:00:00",
+        from_timezone="America/New_York",
+        to_timezone="UTC",
+    )
+
+    assert summer["converted_datetime"] == "2024-07-01T16:00:00+00:00"
+    assert winter["converted_datetime"] == "2024-01-15T17:00:00+00:00"
+
+
+def test_timezone_lookup_is_memoized():
+    """Test zones are loaded once per name while unknown names keep raising."""
+    import pytz
+    from mac_calendar_mcp.server import _tz
+
+    assert _tz("Europe/London") is _tz("Europe/London")
+    for _ in range(2):
+        with pytest.raises(pytz.exceptions.UnknownTimeZoneError):
+            _tz("Invalid/Timezone")
+
+
 @pytest.mark.asyncio
 async def test_convert_time_invalid_from_timezone(calendar_server):
     """Test error handling for invalid from_timezone."""
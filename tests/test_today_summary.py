@@ -7,9 +7,11 @@ from tests.mocks.mock_eventkit import (
     MockEKEventStore,
     MockEKCalendar,
     MockEKEvent,
+    MockEKParticipant,
     MockEKReminder,
     MockEKDateComponents,
     EKAuthorizationStatusAuthorized,
+    EKParticipantStatusAccepted,
 )
 
 
@@ -19,7 +21,6 @@ def calendar_server(monkeypatch):
     monkeypatch.setattr("mac_calendar_mcp.server.EKEventStore", MockEKEventStore)
 
     server = CalendarServer()
-    server.event_store.set_authorized(True)
 
     # Add test calendars
     event_calendar = MockEKCalendar("Calendar")
@@ -58,13 +59,11 @@ async def test_today_summary_with_events(calendar_server):
     # Create today's events
     event1 = MockEKEvent("Morning Meeting", start, end, event_calendar)
     event2 = MockEKEvent("Afternoon Review", start + timedelta(hours=4), end + timedelta(hours=4), event_calendar)
-    server.event_store.add_event(event1)
-    server.event_store.add_event(event2)
 
     # Create tomorrow's event (should not appear)
     tomorrow = today + timedelta(days=1)
     event3 = MockEKEvent("Tomorrow's Meeting", tomorrow, tomorrow + timedelta(hours=1), event_calendar)
-    server.event_store.add_event(event3)
+    server.event_store.bulk_add_events([event1, event2, event3])
 
     summary = await server.get_today_summary()
 
@@ -129,3 +128,22 @@ async def test_today_summary_date_format(calendar_server):
     # Date should be in YYYY-MM-DD format
     today_str = datetime.now().strftime("%Y-%m-%d")
     assert summary["date"] == today_str
+
+
+@pytest.mark.asyncio
+async def test_today_summary_includes_attendees(calendar_server):
+    """Test today's events carry attendee details unless include_attendees is False."""
+    server, event_calendar, reminder_calendar = calendar_server
+
+    start = datetime.now().replace(hour=10, minute=0, second=0, microsecond=0)
+    attendees = [MockEKParticipant("Alice", "alice@example.com", EKParticipantStatusAccepted)]
+    server.event_store.add_event(
+        MockEKEvent("Standup", start, start + timedelta(hours=1), event_calendar, attendees=attendees)
+    )
+
+    summary = await server.get_today_summary()
+    assert [a["name"] for a in summary["events"][0]["attendees"]] == ["Alice"]
+
+    summary = await server.get_today_summary(include_attendees=False)
+    assert summary["events"][0]["attendees"] == []
+    assert summary["events"][0]["attendee_count"] == 1